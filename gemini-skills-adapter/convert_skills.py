@@ -9,10 +9,19 @@ import os
 import re
 import glob
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
 
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---\n(.*)', re.DOTALL)
+# frontmatter 中的 key: value 行（按第一个冒号切分）
+_FRONTMATTER_KV_RE = re.compile(r'^([^:\n]*):(.*)$', re.MULTILINE)
+_SUPERPOWERS_RE = re.compile(r'superpowers:[\w-]+')
+_SKILL_RE = re.compile(r'Skill\([^)]+\)')
+_TODO_RE = re.compile(r'TodoWrite\([^)]+\)')
+
+
 class SuperpowersConverter:
     """Superpowers 技能转 Gemini 格式转换器"""
 
@@ -20,11 +29,13 @@ class SuperpowersConverter:
         self.source_dir = Path(source_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 已转换技能的 (名称, 描述)，供生成索引时使用，避免重新读取
+        self._parsed = []
 
     def parse_skill_md(self, content: str) -> tuple[dict, str]:
         """解析 SKILL.md 的 frontmatter 和 body"""
         # 提取 YAML frontmatter
-        frontmatter_match = re.match(r'^---\n(.*?)\n---\n(.*)', content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
         if not frontmatter_match:
             return {}, content
 
@@ -32,20 +43,15 @@ class SuperpowersConverter:
         body = frontmatter_match.group(2)
 
         # 解析 YAML
-        metadata = {}
-        for line in frontmatter_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
+        metadata = {
+            key.strip(): value.strip()
+            for key, value in _FRONTMATTER_KV_RE.findall(frontmatter_text)
+        }
 
         return metadata, body
 
-    def convert_skill_to_gemini_format(self, skill_path: Path) -> str:
+    def convert_skill_to_gemini_format(self, metadata: dict, body: str, skill_path: Path) -> str:
         """转换单个技能为 Gemini 系统提示词格式"""
-        with open(skill_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        metadata, body = self.parse_skill_md(content)
         skill_name = metadata.get('name', skill_path.parent.name)
         description = metadata.get('description', '')
 
@@ -68,45 +74,81 @@ class SuperpowersConverter:
 
     def _process_body(self, body: str) -> str:
         """处理技能内容，移除特定于 Claude 的引用"""
+        # 三次替换有先后依赖（如 TodoWrite(Skill(x)) 需先替换内层 Skill），必须按顺序执行
         # 移除 superpowers: 技能引用
-        body = re.sub(r'superpowers:[\w-]+', '[RELATED WORKFLOW]', body)
+        body = _SUPERPOWERS_RE.sub('[RELATED WORKFLOW]', body)
 
         # 移除 Skill 工具引用
-        body = re.sub(r'Skill\([^)]+\)', '[Use related workflow]', body)
+        body = _SKILL_RE.sub('[Use related workflow]', body)
 
         # 移除 TodoWrite 引用
-        body = re.sub(r'TodoWrite\([^)]+\)', '[Track this task]', body)
+        body = _TODO_RE.sub('[Track this task]', body)
 
         return body
 
+    def _find_skill_files(self) -> list[Path]:
+        """扫描源目录下的 */SKILL.md（一次 scandir，不走 glob 匹配）"""
+        if not self.source_dir.is_dir():
+            return []
+
+        skill_files = []
+        with os.scandir(self.source_dir) as entries:
+            for entry in entries:
+                skill_file = Path(entry.path, 'SKILL.md')
+                if entry.is_dir() and skill_file.is_file():
+                    skill_files.append(skill_file)
+        return skill_files
+
     def convert_all(self):
         """转换所有技能"""
-        skill_files = list(self.source_dir.glob('*/SKILL.md'))
+        skill_files = self._find_skill_files()
 
         print(f"Found {len(skill_files)} skills to convert")
 
-        for skill_file in skill_files:
-            metadata, _ = self.parse_skill_md(skill_file.read_text(encoding='utf-8'))
-            skill_name = metadata.get('name', skill_file.parent.name)
-
-            # 转换
-            gemini_prompt = self.convert_skill_to_gemini_format(skill_file)
-
-            # 保存
-            output_file = self.output_dir / f"{skill_name}.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(gemini_prompt)
-
-            print(f"  [OK] Converted: {skill_name} -> {output_file.name}")
+        # 各技能相互独立，分发到多个进程并行转换
+        # 按文件大小从大到小提交，小文件填补空闲进程，缩短尾部等待；按完成顺序输出
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    _convert_skill_file,
+                    str(skill_file),
+                    str(self.source_dir),
+                    str(self.output_dir)
+                ): skill_file
+                for skill_file in sorted(skill_files, key=lambda p: p.stat().st_size, reverse=True)
+            }
+            parsed = {}
+            for future in as_completed(futures):
+                skill_name, description, output_name = future.result()
+                parsed[futures[future]] = (skill_name, description)
+                print(f"  [OK] Converted: {skill_name} -> {output_name}")
+
+        # 索引仍按扫描顺序生成
+        self._parsed = [parsed[skill_file] for skill_file in skill_files]
 
         # 生成技能切换脚本
         self._generate_switch_script()
 
         # 生成索引
-        self._generate_index(skill_files)
+        self._generate_index()
 
         print(f"\n[OK] Done! Skills saved to: {self.output_dir}")
 
+    def convert_and_save(self, skill_file: Path) -> tuple[str, str, str]:
+        """转换并保存单个技能，返回 (技能名, 描述, 输出文件名)"""
+        # 只读取并解析一次
+        metadata, body = self.parse_skill_md(skill_file.read_text(encoding='utf-8'))
+        skill_name = metadata.get('name', skill_file.parent.name)
+
+        # 转换
+        gemini_prompt = self.convert_skill_to_gemini_format(metadata, body, skill_file)
+
+        # 保存
+        output_file = self.output_dir / f"{skill_name}.md"
+        output_file.write_text(gemini_prompt, encoding='utf-8')
+
+        return skill_name, metadata.get('description', ''), output_file.name
+
     def _generate_switch_script(self):
         """生成技能切换脚本"""
         script_content = """#!/usr/bin/env bash
@@ -179,27 +221,27 @@ echo    系统提示词: %SKILL_FILE%
         with open(batch_path, 'w', encoding='utf-8') as f:
             f.write(batch_content)
 
-    def _generate_index(self, skill_files):
+    def _generate_index(self):
         """生成技能索引文件"""
-        index_content = "# Superpowers 技能索引\n\n"
-        index_content += "这是为 Gemini CLI 转换的 Superpowers 技能集。\n\n"
-        index_content += "## 使用方法\n\n"
-        index_content += "```bash\n# 切换到某个技能\nexport GEMINI_SYSTEM_MD=/path/to/skill.md\n\n"
-        index_content += "# 或使用切换脚本\n./switch-skill.sh brainstorming\n```\n\n"
-        index_content += "## 技能列表\n\n"
-
-        for skill_file in skill_files:
-            metadata, _ = self.parse_skill_md(skill_file.read_text(encoding='utf-8'))
-            skill_name = metadata.get('name', skill_file.parent.name)
-            description = metadata.get('description', '')
-
-            index_content += f"### {skill_name}\n\n"
-            index_content += f"**描述:** {description}\n\n"
-            index_content += f"**文件:** `{skill_name}.md`\n\n"
-
         index_path = self.output_dir / "INDEX.md"
         with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+            f.write("# Superpowers 技能索引\n\n")
+            f.write("这是为 Gemini CLI 转换的 Superpowers 技能集。\n\n")
+            f.write("## 使用方法\n\n")
+            f.write("```bash\n# 切换到某个技能\nexport GEMINI_SYSTEM_MD=/path/to/skill.md\n\n")
+            f.write("# 或使用切换脚本\n./switch-skill.sh brainstorming\n```\n\n")
+            f.write("## 技能列表\n\n")
+
+            for skill_name, description in self._parsed:
+                f.write(f"### {skill_name}\n\n")
+                f.write(f"**描述:** {description}\n\n")
+                f.write(f"**文件:** `{skill_name}.md`\n\n")
+
+
+def _convert_skill_file(skill_path: str, source_dir: str, output_dir: str) -> tuple[str, str, str]:
+    """工作进程入口：只接收路径字符串，避免序列化转换器对象"""
+    converter = SuperpowersConverter(source_dir, output_dir)
+    return converter.convert_and_save(Path(skill_path))
 
 
 def main():
@@ -11,99 +11,141 @@ Superpowers 技能转 Gemini CLI 优化版中英双语系统提示词
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple
 
 
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---\n(.*)', re.DOTALL)
+# frontmatter 中的 key: value 行（按第一个冒号切分）
+_FRONTMATTER_KV_RE = re.compile(r'^([^:\n]*):(.*)$', re.MULTILINE)
+_CODE_FENCE_LANG_RE = re.compile(r'^```\s*(\w+)?')
+_SUPERPOWERS_RE = re.compile(r'superpowers:([a-zA-Z-]+)')
+
+# 技能名称翻译
+SKILL_NAMES = {
+    'brainstorming': '头脑风暴',
+    'writing-plans': '编写计划',
+    'systematic-debugging': '系统化调试',
+    'test-driven-development': '测试驱动开发',
+    'using-git-worktrees': '使用 Git 工作树',
+    'subagent-driven-development': '子代理驱动开发',
+    'executing-plans': '执行计划',
+    'verification-before-completion': '完成前验证',
+    'requesting-code-review': '请求代码审查',
+    'receiving-code-review': '接收代码审查',
+    'finishing-a-development-branch': '完成开发分支',
+    'dispatching-parallel-agents': '分发并行任务',
+    'writing-skills': '编写技能',
+    'using-superpowers': '使用 Superpowers',
+}
+
+# 标题翻译（用于添加注释）
+TITLE_TRANSLATIONS = {
+    'Overview': '概述',
+    'Core principle': '核心原则',
+    'When to Use': '使用时机',
+    'The Process': '流程',
+    'Instructions': '指令',
+    'Description': '描述',
+    'Key Principles': '关键原则',
+    'Important Notes': '重要说明',
+    'Red-Green-Refactor': '红绿重构循环',
+    'The Iron Law': '铁律',
+    'Exceptions': '例外情况',
+}
+
+# 标题中的技术术语翻译
+TERM_TRANSLATIONS = {
+    'RED': 'RED (红 - 编写失败的测试)',
+    'GREEN': 'GREEN (绿 - 编写最小代码)',
+    'REFACTOR': 'REFACTOR (重构 - 清理代码)',
+}
+
+# 一次匹配两种标题：
+# - "## Title"（所有 TITLE_TRANSLATIONS 合并为一个交替模式）
+# - "### RED - Write Failing Test"（包含技术术语的标题）
+_HEADING_RE = re.compile(
+    r'^(?P<hashes>#{2,4})\s+(?:'
+    r'(?P<title>' + '|'.join(re.escape(en_title) for en_title in TITLE_TRANSLATIONS) + r')\s*'
+    r'|(?P<term>[A-Z-]+)\s+-\s+(?P<description>.+)'
+    r')$'
+)
+
+# 重要段落翻译（英文 -> 中文）
+PARAGRAPH_TRANSLATIONS = {
+    # brainstorming
+    "Help turn ideas into fully formed designs and specs through natural collaborative dialogue.":
+        "【通过自然的对话协作，将想法转化为完整的设计和规格】",
+
+    "Start by understanding the current project context, then ask questions one at a time to refine the idea.":
+        "【首先了解当前项目状态，然后逐个提问来完善想法】",
+
+    "Once you understand what you're building, present the design in small sections (200-300 words), checking after each section whether it looks right so far.":
+        "【一旦你理解了要构建的内容，分段展示设计（每段 200-300 字），每段后确认是否正确】",
+
+    # TDD
+    "Write the test first. Watch it fail. Write minimal code to pass.":
+        "【先写测试。看它失败。编写最小代码让它通过】",
+
+    "Core principle: If you didn't watch the test fail, you don't know if it tests the right thing.":
+        "【核心原则：如果你没有看到测试失败，你就不知道它是否测试了正确的东西】",
+
+    "Violating the letter of the rules is violating the spirit of the rules.":
+        "【违反规则的字面意思就是违反规则的精神】",
+
+    "NO PRODUCTION CODE WITHOUT A FAILING TEST FIRST":
+        "【没有失败的测试，就不写生产代码】",
+
+    "Write code before the test? Delete it. Start over.":
+        "【在测试之前写了代码？删除它。重新开始】",
+
+    # debugging
+    "Use when encountering any bug, test failure, or unexpected behavior, before proposing fixes.":
+        "【遇到任何 bug、测试失败或意外行为时使用，在提出修复方案之前】",
+
+    # general
+    "Follow these instructions EXACTLY":
+        "【严格遵循这些指令】",
+
+    "Do not skip any steps":
+        "【不要跳过任何步骤】",
+
+    "If the workflow doesn't apply to the current task, state that clearly":
+        "【如果工作流程不适用于当前任务，明确说明】",
+
+    # writing-plans
+    "Write comprehensive implementation plans assuming the engineer has zero context for our codebase and questionable taste.":
+        "【编写全面的实现计划，假设工程师对代码库零背景且品味存疑】",
+
+    "Document everything they need to know: which files to touch for each task, code, testing, docs they might need to check, how to test it.":
+        "【记录他们需要知道的一切：每个任务要修改哪些文件、代码、测试、文档、如何测试】",
+
+    # systematic-debugging
+    "A 4-phase process for finding root causes of bugs and unexpected behavior.":
+        "【一个 4 阶段流程，用于找出 bug 和意外行为的根本原因】",
+}
+
+# 所有段落合并为一个交替模式，单次扫描即可找到命中的段落
+_PARAGRAPH_RE = re.compile(
+    '|'.join(re.escape(en_paragraph) for en_paragraph in PARAGRAPH_TRANSLATIONS)
+)
+
+# 正文中任何可能被处理的内容：superpowers: 引用、二到四级标题、重要段落
+_BODY_TRIGGER_RE = re.compile(
+    r'superpowers:[a-zA-Z-]|^#{2,4}\s|' + _PARAGRAPH_RE.pattern,
+    re.MULTILINE
+)
+
+
 class OptimizedBilingualConverter:
     """优化版中英双语转换器"""
 
-    # 技能名称翻译
-    SKILL_NAMES = {
-        'brainstorming': '头脑风暴',
-        'writing-plans': '编写计划',
-        'systematic-debugging': '系统化调试',
-        'test-driven-development': '测试驱动开发',
-        'using-git-worktrees': '使用 Git 工作树',
-        'subagent-driven-development': '子代理驱动开发',
-        'executing-plans': '执行计划',
-        'verification-before-completion': '完成前验证',
-        'requesting-code-review': '请求代码审查',
-        'receiving-code-review': '接收代码审查',
-        'finishing-a-development-branch': '完成开发分支',
-        'dispatching-parallel-agents': '分发并行任务',
-        'writing-skills': '编写技能',
-        'using-superpowers': '使用 Superpowers',
-    }
-
-    # 标题翻译（用于添加注释）
-    TITLE_TRANSLATIONS = {
-        'Overview': '概述',
-        'Core principle': '核心原则',
-        'When to Use': '使用时机',
-        'The Process': '流程',
-        'Instructions': '指令',
-        'Description': '描述',
-        'Key Principles': '关键原则',
-        'Important Notes': '重要说明',
-        'Red-Green-Refactor': '红绿重构循环',
-        'The Iron Law': '铁律',
-        'Exceptions': '例外情况',
-    }
-
-    # 重要段落翻译（英文 -> 中文）
-    PARAGRAPH_TRANSLATIONS = {
-        # brainstorming
-        "Help turn ideas into fully formed designs and specs through natural collaborative dialogue.":
-            "【通过自然的对话协作，将想法转化为完整的设计和规格】",
-
-        "Start by understanding the current project context, then ask questions one at a time to refine the idea.":
-            "【首先了解当前项目状态，然后逐个提问来完善想法】",
-
-        "Once you understand what you're building, present the design in small sections (200-300 words), checking after each section whether it looks right so far.":
-            "【一旦你理解了要构建的内容，分段展示设计（每段 200-300 字），每段后确认是否正确】",
-
-        # TDD
-        "Write the test first. Watch it fail. Write minimal code to pass.":
-            "【先写测试。看它失败。编写最小代码让它通过】",
-
-        "Core principle: If you didn't watch the test fail, you don't know if it tests the right thing.":
-            "【核心原则：如果你没有看到测试失败，你就不知道它是否测试了正确的东西】",
-
-        "Violating the letter of the rules is violating the spirit of the rules.":
-            "【违反规则的字面意思就是违反规则的精神】",
-
-        "NO PRODUCTION CODE WITHOUT A FAILING TEST FIRST":
-            "【没有失败的测试，就不写生产代码】",
-
-        "Write code before the test? Delete it. Start over.":
-            "【在测试之前写了代码？删除它。重新开始】",
-
-        # debugging
-        "Use when encountering any bug, test failure, or unexpected behavior, before proposing fixes.":
-            "【遇到任何 bug、测试失败或意外行为时使用，在提出修复方案之前】",
-
-        # general
-        "Follow these instructions EXACTLY":
-            "【严格遵循这些指令】",
-
-        "Do not skip any steps":
-            "【不要跳过任何步骤】",
-
-        "If the workflow doesn't apply to the current task, state that clearly":
-            "【如果工作流程不适用于当前任务，明确说明】",
-
-        # writing-plans
-        "Write comprehensive implementation plans assuming the engineer has zero context for our codebase and questionable taste.":
-            "【编写全面的实现计划，假设工程师对代码库零背景且品味存疑】",
-
-        "Document everything they need to know: which files to touch for each task, code, testing, docs they might need to check, how to test it.":
-            "【记录他们需要知道的一切：每个任务要修改哪些文件、代码、测试、文档、如何测试】",
-
-        # systematic-debugging
-        "A 4-phase process for finding root causes of bugs and unexpected behavior.":
-            "【一个 4 阶段流程，用于找出 bug 和意外行为的根本原因】",
-    }
+    # 翻译表定义在模块级，这里保留类属性以便通过类访问
+    SKILL_NAMES = SKILL_NAMES
+    TITLE_TRANSLATIONS = TITLE_TRANSLATIONS
+    TERM_TRANSLATIONS = TERM_TRANSLATIONS
+    PARAGRAPH_TRANSLATIONS = PARAGRAPH_TRANSLATIONS
 
     def __init__(self, source_dir: str, output_dir: str):
         self.source_dir = Path(source_dir)
@@ -112,43 +154,30 @@ class OptimizedBilingualConverter:
 
     def parse_skill_md(self, content: str) -> Tuple[dict, str]:
         """解析 SKILL.md 的 frontmatter 和 body"""
-        frontmatter_match = re.match(r'^---\n(.*?)\n---\n(.*)', content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
         if not frontmatter_match:
             return {}, content
 
         frontmatter_text = frontmatter_match.group(1)
         body = frontmatter_match.group(2)
 
-        metadata = {}
-        for line in frontmatter_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
+        metadata = {
+            key.strip(): value.strip()
+            for key, value in _FRONTMATTER_KV_RE.findall(frontmatter_text)
+        }
 
         return metadata, body
 
-    def add_title_translation(self, line: str) -> str:
-        """为标题添加中文注释"""
-        for en_title, zh_title in self.TITLE_TRANSLATIONS.items():
-            # 匹配 ## Title 或 ### Title 格式
-            pattern = r'^(#{2,4})\s+' + re.escape(en_title) + r'\s*$'
-            match = re.match(pattern, line, re.MULTILINE)
-            if match:
-                hashes = match.group(1)
-                return f"{hashes} {en_title} ({zh_title})"
-
-        return line
-
     def add_paragraph_translation(self, line: str) -> str:
         """为重要段落添加中文翻译（作为行尾注释）"""
-        stripped = line.strip()
+        # 避免重复添加
+        if '【' in line:
+            return line
 
         # 检查是否是需要翻译的段落
-        for en_paragraph, zh_translation in self.PARAGRAPH_TRANSLATIONS.items():
-            if en_paragraph in stripped:
-                # 避免重复添加
-                if '【' not in line:
-                    return line + '\n' + zh_translation
+        match = _PARAGRAPH_RE.search(line)
+        if match:
+            return line + '\n' + PARAGRAPH_TRANSLATIONS[match.group(0)]
 
         return line
 
@@ -163,7 +192,7 @@ class OptimizedBilingualConverter:
                 return True, False, ''
             else:
                 # 代码块开始，提取语言
-                lang_match = re.match(r'^```\s*(\w+)?', line.strip())
+                lang_match = _CODE_FENCE_LANG_RE.match(line.strip())
                 lang = lang_match.group(1) if lang_match and lang_match.group(1) else ''
                 return True, True, lang
         # 代码块内的行（非边界）
@@ -171,55 +200,55 @@ class OptimizedBilingualConverter:
 
     def is_list_item(self, line: str) -> bool:
         """判断是否是列表项"""
-        return re.match(r'^\s*[-*]\s+', line) is not None
-
-    def translate_heading_with_term(self, line: str) -> str:
-        """翻译包含技术术语的标题"""
-        # 处理类似 "### RED - Write Failing Test" 的格式
-        match = re.match(r'^(#{2,4})\s+([A-Z-]+)\s+-\s+(.+)$', line)
-        if match:
-            hashes, term, description = match.groups()
-            # 为术语添加中文注释
-            term_translations = {
-                'RED': 'RED (红 - 编写失败的测试)',
-                'GREEN': 'GREEN (绿 - 编写最小代码)',
-                'REFACTOR': 'REFACTOR (重构 - 清理代码)',
-            }
-            translated_term = term_translations.get(term, term)
-            return f"{hashes} {translated_term} - {description}"
-
-        return line
+        # 等价于 ^\s*[-*]\s+，但不经过正则引擎
+        stripped = line.lstrip()
+        return len(stripped) > 1 and stripped[0] in '-*' and stripped[1].isspace()
+
+    def translate_heading(self, line: str) -> str:
+        """为标题添加中文注释（普通标题和包含技术术语的标题）"""
+        match = _HEADING_RE.match(line)
+        if not match:
+            return line
+
+        hashes = match.group('hashes')
+        if match.group('title'):
+            en_title = match.group('title')
+            return f"{hashes} {en_title} ({TITLE_TRANSLATIONS[en_title]})"
+
+        term = match.group('term')
+        translated_term = TERM_TRANSLATIONS.get(term, term)
+        return f"{hashes} {translated_term} - {match.group('description')}"
+
+    def translate_line(self, line: str) -> str:
+        """处理代码块外的一行"""
+        if line.startswith('#'):
+            # 标题：添加中文注释后替换 superpowers: 引用
+            return self.replace_superpowers_references(self.translate_heading(line))
+
+        line = self.replace_superpowers_references(line)
+
+        # 处理重要段落（添加中文翻译），列表项除外
+        if self.is_list_item(line):
+            return line
+        return self.add_paragraph_translation(line)
 
     def replace_superpowers_references(self, line: str) -> str:
         """替换 superpowers: 引用为 Gemini CLI 兼容格式"""
         # superpowers:skill-name -> 切换到技能 skill-name.md
         # 处理可能的前缀（如 > 或其他 markdown 标记）
         # 使用非贪婪匹配来保护前缀和后缀
-        line = re.sub(
-            r'superpowers:([a-zA-Z-]+)',
-            r'切换到技能 \1.md (使用 gskill \1)',
-            line
-        )
+        line = _SUPERPOWERS_RE.sub(r'切换到技能 \1.md (使用 gskill \1)', line)
 
         return line
 
-    def convert_skill_to_bilingual(self, skill_path: Path) -> str:
-        """转换单个技能为优化版双语格式"""
-        with open(skill_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        metadata, body = self.parse_skill_md(content)
-        skill_name = metadata.get('name', skill_path.parent.name)
-        description = metadata.get('description', '')
-        skill_name_zh = self.SKILL_NAMES.get(skill_name, skill_name)
-
-        # 处理正文
+    def translate_body(self, body: str) -> str:
+        """逐行处理正文，跟踪代码块状态"""
         lines = body.split('\n')
         translated_lines = []
         in_code_block = False
         code_block_lang = ''
 
-        for i, line in enumerate(lines):
+        for line in lines:
             # 检查代码块状态
             is_boundary, in_code_block, code_block_lang = self.is_code_block(line, in_code_block, code_block_lang)
 
@@ -239,20 +268,21 @@ class OptimizedBilingualConverter:
                 continue
 
             # 不在代码块中，正常处理
-            # 处理标题（添加中文注释）
-            new_line = self.add_title_translation(line)
-
-            # 处理包含技术术语的标题
-            new_line = self.translate_heading_with_term(new_line)
+            translated_lines.append(self.translate_line(line))
 
-            # 替换 superpowers: 引用
-            new_line = self.replace_superpowers_references(new_line)
+        return '\n'.join(translated_lines)
 
-            # 处理重要段落（添加中文翻译）
-            if not self.is_list_item(new_line) and not new_line.startswith('#'):
-                new_line = self.add_paragraph_translation(new_line)
+    def convert_skill_to_bilingual(self, metadata: dict, body: str, skill_path: Path) -> str:
+        """转换单个技能为优化版双语格式"""
+        skill_name = metadata.get('name', skill_path.parent.name)
+        description = metadata.get('description', '')
+        skill_name_zh = SKILL_NAMES.get(skill_name, skill_name)
 
-            translated_lines.append(new_line)
+        # 处理正文：不含任何可处理内容时原样输出，跳过逐行处理
+        if _BODY_TRIGGER_RE.search(body):
+            instructions = self.translate_body(body)
+        else:
+            instructions = body
 
         # 构建最终内容
         bilingual_format = f"""# {skill_name.replace('-', ' ').title()} ({skill_name_zh})
@@ -262,7 +292,7 @@ class OptimizedBilingualConverter:
 
 ## Instructions / 指令
 
-{chr(10).join(translated_lines)}
+{instructions}
 
 ---
 
@@ -280,36 +310,68 @@ class OptimizedBilingualConverter:
 
         return bilingual_format
 
+    def _find_skill_files(self) -> List[Path]:
+        """扫描源目录下的 */SKILL.md（一次 scandir，不走 glob 匹配）"""
+        if not self.source_dir.is_dir():
+            return []
+
+        skill_files = []
+        with os.scandir(self.source_dir) as entries:
+            for entry in entries:
+                skill_file = Path(entry.path, 'SKILL.md')
+                if entry.is_dir() and skill_file.is_file():
+                    skill_files.append(skill_file)
+        return skill_files
+
     def convert_all(self):
         """转换所有技能"""
-        skill_files = list(self.source_dir.glob('*/SKILL.md'))
+        skill_files = self._find_skill_files()
 
         print(f"Found {len(skill_files)} skills to convert")
         print("Using optimized bilingual strategy (注释式双语)\n")
 
-        for skill_file in skill_files:
-            metadata, _ = self.parse_skill_md(skill_file.read_text(encoding='utf-8'))
-            skill_name = metadata.get('name', skill_file.parent.name)
-            skill_name_zh = self.SKILL_NAMES.get(skill_name, skill_name)
-
-            # 转换
-            bilingual_prompt = self.convert_skill_to_bilingual(skill_file)
-
-            # 保存
-            output_file = self.output_dir / f"{skill_name}.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(bilingual_prompt)
-
-            print(f"  [OK] {skill_name_zh} ({skill_name}) -> {output_file.name}")
+        # 各技能相互独立，分发到多个进程并行转换
+        # 按文件大小从大到小提交，小文件填补空闲进程，缩短尾部等待；按完成顺序输出
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    _convert_skill_file,
+                    str(skill_file),
+                    str(self.source_dir),
+                    str(self.output_dir)
+                ): skill_file
+                for skill_file in sorted(skill_files, key=lambda p: p.stat().st_size, reverse=True)
+            }
+            for future in as_completed(futures):
+                skill_name, output_name = future.result()
+                skill_name_zh = SKILL_NAMES.get(skill_name, skill_name)
+                print(f"  [OK] {skill_name_zh} ({skill_name}) -> {output_name}")
 
         # 生成使用说明
         self._generate_usage_guide(len(skill_files))
 
         print(f"\n[OK] Conversion complete! Skills saved to: {self.output_dir}")
 
+    def convert_and_save(self, skill_file: Path) -> Tuple[str, str]:
+        """转换并保存单个技能，返回 (技能名, 输出文件名)"""
+        # 只读取并解析一次
+        metadata, body = self.parse_skill_md(skill_file.read_text(encoding='utf-8'))
+        skill_name = metadata.get('name', skill_file.parent.name)
+
+        # 转换
+        bilingual_prompt = self.convert_skill_to_bilingual(metadata, body, skill_file)
+
+        # 保存
+        output_file = self.output_dir / f"{skill_name}.md"
+        output_file.write_text(bilingual_prompt, encoding='utf-8')
+
+        return skill_name, output_file.name
+
     def _generate_usage_guide(self, skill_count: int):
         """生成使用指南"""
-        guide = f"""# Superpowers 技能集 - Gemini CLI 双语版
+        guide_path = self.output_dir / "README.md"
+        with open(guide_path, 'w', encoding='utf-8') as f:
+            f.write(f"""# Superpowers 技能集 - Gemini CLI 双语版
 
 本目录包含 {skill_count} 个 Superpowers 技能的优化版中英双语版本。
 
@@ -364,12 +426,12 @@ gemini "帮我调试这个问题"
 
 ## 技能列表
 
-"""
+""")
 
-        for skill_name_en, skill_name_zh in sorted(self.SKILL_NAMES.items()):
-            guide += f"- **{skill_name_zh}** (`{skill_name_en}.md`)\n"
+            for skill_name_en, skill_name_zh in sorted(SKILL_NAMES.items()):
+                f.write(f"- **{skill_name_zh}** (`{skill_name_en}.md`)\n")
 
-        guide += f"""
+            f.write(f"""
 ## 典型工作流示例
 
 ### 开发新功能
@@ -421,11 +483,7 @@ gemini "修复完成了，帮我验证"
 
 本适配器基于 Superpowers 的 MIT 许可证。
 Superpowers 原项目：https://github.com/obra/superpowers
-"""
-
-        guide_path = self.output_dir / "README.md"
-        with open(guide_path, 'w', encoding='utf-8') as f:
-            f.write(guide)
+""")
 
         # 复制切换脚本
         self._copy_switch_scripts()
@@ -448,6 +506,12 @@ Superpowers 原项目：https://github.com/obra/superpowers
             shutil.copy(bat_script, self.output_dir / "switch-skill.bat")
 
 
+def _convert_skill_file(skill_path: str, source_dir: str, output_dir: str) -> Tuple[str, str]:
+    """工作进程入口：只接收路径字符串，避免序列化转换器对象"""
+    converter = OptimizedBilingualConverter(source_dir, output_dir)
+    return converter.convert_and_save(Path(skill_path))
+
+
 def main():
     import argparse
 